@@ -211,8 +211,8 @@ def restore_backup_tar(
         # Read and validate manifest
         manifest_path = tmp_dir / "manifest.json"
         try:
-            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
+            manifest = json.loads(manifest_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             raise BackupError(f"Invalid manifest: {exc}") from exc
 
         if manifest.get("version") != MANIFEST_VERSION:
@@ -102,6 +102,14 @@ class ExitStore:
         ).fetchone()
         return row[0] if row else ""
 
+    def get_state(self) -> tuple[bool, str]:
+        """Return (enabled, active_exit_name) from a single config query."""
+        rows = dict(self._conn.execute(
+            "SELECT key, value FROM config "
+            "WHERE key IN ('multihop_enabled', 'active_exit')"
+        ).fetchall())
+        return rows.get("multihop_enabled") == "1", rows.get("active_exit") or ""
+
     # ── CRUD ─────────────────────────────────────────────────────
 
     def add_exit(
@@ -20,6 +20,7 @@ import importlib.resources
 import ipaddress
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Type
 
@@ -72,6 +73,8 @@ def _resolve_templates(spec: dict, context: dict) -> dict:
     return result
 
 
+# Preset readers are cached — _resolve_templates deep-copies before substituting.
+@lru_cache(maxsize=1)
 def _read_core_preset() -> dict:
     """Read core.yaml from package resources."""
     ref = importlib.resources.files(
@@ -92,6 +95,7 @@ def _resolve_core_preset(env: DaemonEnv, wallet: Wallet) -> dict:
     return _resolve_templates(spec, context)
 
 
+@lru_cache(maxsize=1)
 def _read_multihop_preset() -> dict:
     """Read multihop.yaml from package resources."""
     ref = importlib.resources.files(
@@ -116,6 +120,7 @@ def resolve_multihop_preset(
     return _resolve_templates(spec, context)
 
 
+@lru_cache(maxsize=1)
 def _read_multihop_v6_preset() -> dict:
     """Read multihop-v6.yaml from package resources."""
     ref = importlib.resources.files(
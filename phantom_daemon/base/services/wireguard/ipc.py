@@ -15,13 +15,14 @@ IPC config builder and parser — pure functions, no FFI dependency.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 
 # ── UAPI Status Types ────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerStatus:
     public_key: str = ""
     endpoint: str = ""
@@ -32,7 +33,7 @@ class PeerStatus:
     keepalive: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceStatus:
     public_key: str = ""
     listen_port: int = 0
@@ -128,6 +129,28 @@ def parse_ipc_peers(ipc_output: str) -> set[str]:
     return peers
 
 
+# UAPI peer key → (PeerStatus attribute, converter).
+# allowed_ip accumulates; last_handshake_time_nsec and unknown keys are ignored.
+_PEER_SCALAR_FIELDS: dict[str, tuple[str, Callable[[str], object]]] = {
+    "endpoint": ("endpoint", str),
+    "last_handshake_time_sec": ("latest_handshake", int),
+    "rx_bytes": ("rx_bytes", int),
+    "tx_bytes": ("tx_bytes", int),
+    "persistent_keepalive_interval": ("keepalive", int),
+}
+
+
+def _set_peer_field(peer: PeerStatus, key: str, value: str) -> None:
+    """Apply a single peer-section UAPI line to a PeerStatus."""
+    if key == "allowed_ip":
+        peer.allowed_ips.append(value)
+        return
+    spec = _PEER_SCALAR_FIELDS.get(key)
+    if spec is not None:
+        attr, convert = spec
+        setattr(peer, attr, convert(value))
+
+
 def parse_device_status(ipc_dump: str) -> DeviceStatus:
     """Parse full UAPI dump into structured DeviceStatus.
 
@@ -156,20 +179,31 @@ def parse_device_status(ipc_dump: str) -> DeviceStatus:
             current_peer = PeerStatus(public_key=value)
             device.peers.append(current_peer)
         elif current_peer is not None:
-            if key == "endpoint":
-                current_peer.endpoint = value
-            elif key == "allowed_ip":
-                current_peer.allowed_ips.append(value)
-            elif key == "last_handshake_time_sec":
-                current_peer.latest_handshake = int(value)
-            elif key == "last_handshake_time_nsec":
-                pass  # sec precision sufficient
-            elif key == "rx_bytes":
-                current_peer.rx_bytes = int(value)
-            elif key == "tx_bytes":
-                current_peer.tx_bytes = int(value)
-            elif key == "persistent_keepalive_interval":
-                current_peer.keepalive = int(value)
-            # Unknown keys silently ignored
+            _set_peer_field(current_peer, key, value)
 
     return device
+
+
+def parse_peer_status(ipc_dump: str, public_key_hex: str) -> PeerStatus | None:
+    """Parse only the peer section matching public_key_hex from a UAPI dump.
+
+    Interface fields and all other peers are skipped — no public key
+    derivation, no PeerStatus for unrelated peers.
+    Returns None if the peer is not present.
+    """
+    marker = f"public_key={public_key_hex}"
+    peer: PeerStatus | None = None
+
+    for line in ipc_dump.splitlines():
+        if line.startswith("public_key="):
+            if peer is not None:
+                break  # next peer section — done
+            if line == marker:
+                peer = PeerStatus(public_key=public_key_hex)
+            continue
+        if peer is None or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        _set_peer_field(peer, key, value)
+
+    return peer
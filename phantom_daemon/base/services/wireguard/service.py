@@ -27,11 +27,13 @@ from phantom_daemon.base.errors import WireGuardError
 from phantom_daemon.base.services.wireguard import WG_INTERFACE_NAME
 from phantom_daemon.base.services.wireguard.ipc import (
     DeviceStatus,
+    PeerStatus,
     build_full_config,
     build_peer_config,
     build_peer_remove_config,
     parse_device_status,
     parse_ipc_peers,
+    parse_peer_status,
 )
 
 if TYPE_CHECKING:
@@ -154,6 +156,11 @@ class WireGuardService:
         dump = self._bridge.ipc_get()
         return parse_device_status(dump)
 
+    def get_peer_status(self, public_key_hex: str) -> Optional[PeerStatus]:
+        """Status of a single peer, or None if it is not on the device."""
+        dump = self._bridge.ipc_get()
+        return parse_peer_status(dump, public_key_hex)
+
     def add_peer(self, client: dict, keepalive: int) -> None:
         """Add a single peer to the IPC device.
 
@@ -164,6 +164,25 @@ def _create_wallet(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+# ── Queries ──────────────────────────────────────────────────────
+
+_CLIENT_FIELDS = (
+    "ipv4_address", "ipv6_address", "id", "name", "private_key_hex",
+    "public_key_hex", "preshared_key_hex", "created_at", "updated_at",
+)
+
+_CLIENT_SELECT = (
+    "SELECT ipv4_address, ipv6_address, id, name, "
+    "private_key_hex, public_key_hex, preshared_key_hex, "
+    "created_at, updated_at "
+    "FROM users"
+)
+
+# Fixed statements are built once so every call reuses the same SQL text.
+_CLIENT_BY_NAME = f"{_CLIENT_SELECT} WHERE name = ?"
+_CLIENTS_ASSIGNED = f"{_CLIENT_SELECT} WHERE id IS NOT NULL ORDER BY rowid"
+
+
 # ── Wallet ───────────────────────────────────────────────────────
 
 class Wallet:
@@ -279,41 +298,27 @@ class Wallet:
         self._conn.commit()
 
     @staticmethod
-    def _row_to_client(row) -> dict:
-        return {
-            "ipv4_address": row[0],
-            "ipv6_address": row[1],
-            "id": row[2],
-            "name": row[3],
-            "private_key_hex": row[4],
-            "public_key_hex": row[5],
-            "preshared_key_hex": row[6],
-            "created_at": row[7],
-            "updated_at": row[8],
-        }
-
-    _CLIENT_COLUMNS = (
-        "ipv4_address, ipv6_address, id, name, "
-        "private_key_hex, public_key_hex, preshared_key_hex, "
-        "created_at, updated_at"
-    )
+    def _row_to_client(row: tuple) -> dict:
+        return dict(zip(_CLIENT_FIELDS, row))
 
     def get_client(self, name: str) -> Optional[dict]:
         """Get client by name, or None if not found."""
-        row = self._conn.execute(
-            f"SELECT {self._CLIENT_COLUMNS} FROM users WHERE name = ?",
-            (name,),
-        ).fetchone()
+        row = self._conn.execute(_CLIENT_BY_NAME, (name,)).fetchone()
         if not row:
             return None
         return self._row_to_client(row)
 
     def list_clients(self) -> list[dict]:
         """List all assigned clients ordered by rowid."""
+        rows = self._conn.execute(_CLIENTS_ASSIGNED).fetchall()
+        return [self._row_to_client(r) for r in rows]
+
+    def client_names(self) -> dict[str, str]:
+        """Map public_key_hex → name for all assigned clients."""
         rows = self._conn.execute(
-            f"SELECT {self._CLIENT_COLUMNS} FROM users WHERE id IS NOT NULL ORDER BY rowid"
+            "SELECT public_key_hex, name FROM users WHERE id IS NOT NULL"
         ).fetchall()
-        return [self._row_to_client(r) for r in rows]
+        return dict(rows)
 
     def list_clients_paginated(
         self,
@@ -341,7 +346,7 @@ class Wallet:
         ).fetchone()[0]
 
         rows = self._conn.execute(
-            f"SELECT {self._CLIENT_COLUMNS} FROM users "
+            f"{_CLIENT_SELECT} "
             f"WHERE {where} ORDER BY rowid {safe_order} LIMIT ? OFFSET ?",
             [*params, limit, offset],
         ).fetchall()
@@ -430,18 +435,18 @@ class Wallet:
         self._conn.execute("DELETE FROM users")  # noqa: S608
         _populate_ip_pool(self._conn, new_v4, new_v6)
 
-        # Restore clients into first free slots
-        for backup in backups:
-            slot = self._conn.execute(
-                "SELECT ipv4_address FROM users "
-                "WHERE id IS NULL ORDER BY rowid LIMIT 1"
-            ).fetchone()
-            self._conn.execute(
-                "UPDATE users SET id=?, name=?, private_key_hex=?, "
-                "public_key_hex=?, preshared_key_hex=?, created_at=?, updated_at=? "
-                "WHERE ipv4_address=?",
-                (*backup, slot[0]),
-            )
+        # Restore clients into first free slots (fetched once, single batch)
+        slots = self._conn.execute(
+            "SELECT ipv4_address FROM users "
+            "WHERE id IS NULL ORDER BY rowid LIMIT ?",
+            (len(backups),),
+        ).fetchall()
+        self._conn.executemany(
+            "UPDATE users SET id=?, name=?, private_key_hex=?, "
+            "public_key_hex=?, preshared_key_hex=?, created_at=?, updated_at=? "
+            "WHERE ipv4_address=?",
+            [(*backup, slot[0]) for backup, slot in zip(backups, slots, strict=True)],
+        )
 
         # Update config
         self._conn.execute(
@@ -82,13 +82,12 @@ async def get_status(request: Request):
 
     status = wg.get_status()
 
-    clients = wallet.list_clients()
-    client_map = {c["public_key_hex"]: c for c in clients}
+    client_names = wallet.client_names()
 
     peers = [
         PeerInfo(
             public_key=p.public_key,
-            name=client_map[p.public_key]["name"] if p.public_key in client_map else None,
+            name=client_names.get(p.public_key),
             endpoint=p.endpoint,
             allowed_ips=p.allowed_ips,
             latest_handshake=p.latest_handshake,
@@ -129,21 +128,19 @@ async def get_peer(body: PeerQuery, request: Request):
     if client is None:
         raise DaemonHTTPException(404, "CLIENT_NOT_FOUND", f"Client not found: {body.name}")
 
-    status = wg.get_status()
+    p = wg.get_peer_status(client["public_key_hex"])
+    if p is None:
+        raise DaemonHTTPException(404, "PEER_NOT_FOUND", f"Peer not found in IPC: {body.name}")
 
-    for p in status.peers:
-        if p.public_key == client["public_key_hex"]:
-            return ApiOk(
-                data=PeerInfo(
-                    public_key=p.public_key,
-                    name=body.name,
-                    endpoint=p.endpoint,
-                    allowed_ips=p.allowed_ips,
-                    latest_handshake=p.latest_handshake,
-                    rx_bytes=p.rx_bytes,
-                    tx_bytes=p.tx_bytes,
-                    keepalive=p.keepalive,
-                )
-            )
-
-    raise DaemonHTTPException(404, "PEER_NOT_FOUND", f"Peer not found in IPC: {body.name}")
+    return ApiOk(
+        data=PeerInfo(
+            public_key=p.public_key,
+            name=body.name,
+            endpoint=p.endpoint,
+            allowed_ips=p.allowed_ips,
+            latest_handshake=p.latest_handshake,
+            rx_bytes=p.rx_bytes,
+            tx_bytes=p.tx_bytes,
+            keepalive=p.keepalive,
+        )
+    )
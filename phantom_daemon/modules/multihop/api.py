@@ -169,6 +169,7 @@ async def list_exits(request: Request):
     """List all exit configurations and current state."""
     exit_store = request.app.state.exit_store
     exits = exit_store.list_exits()
+    enabled, active = exit_store.get_state()
     summaries = [
         ExitSummary(
             id=e["id"],
@@ -184,8 +185,8 @@ async def list_exits(request: Request):
     return ApiOk(data=ExitListResponse(
         exits=summaries,
         total=len(summaries),
-        enabled=exit_store.is_enabled(),
-        active=exit_store.get_active(),
+        enabled=enabled,
+        active=active,
     ))
 
 
@@ -303,8 +304,7 @@ async def multihop_status(request: Request):
     """Return current multihop state, active exit info, and live peer stats."""
     exit_store = request.app.state.exit_store
     wg_exit = request.app.state.wg_exit
-    enabled = exit_store.is_enabled()
-    active = exit_store.get_active()
+    enabled, active = exit_store.get_state()
 
     exit_summary = None
     peer_status = None
@@ -322,11 +322,11 @@ async def multihop_status(request: Request):
                 keepalive=exit_data["keepalive"],
             )
 
-    if wg_exit is not None:
+    if wg_exit is not None and exit_summary is not None:
+        # Exit device holds a single peer whose key is already known locally
         try:
-            status = wg_exit.get_status()
-            if status.peers:
-                p = status.peers[0]
+            p = wg_exit.get_peer_status(exit_summary.public_key_hex)
+            if p is not None:
                 peer_status = PeerStatus(
                     endpoint=p.endpoint,
                     latest_handshake=p.latest_handshake,
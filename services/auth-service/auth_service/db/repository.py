@@ -57,6 +57,17 @@ class SessionRow:
     revoked: bool
 
 
+# ── Queries ──────────────────────────────────────────────────────
+
+_USER_SELECT = (
+    "SELECT id, username, password_hash, role, totp_secret, created_at, updated_at "
+    "FROM users"
+)
+_USER_BY_USERNAME = f"{_USER_SELECT} WHERE username = ?"
+_USER_BY_ID = f"{_USER_SELECT} WHERE id = ?"
+_USERS_BY_CREATED = f"{_USER_SELECT} ORDER BY created_at"
+
+
 class AuthDB:
     """Auth database — synchronous SQLite operations."""
 
@@ -95,11 +106,7 @@ class AuthDB:
 
     def get_user_by_username(self, username: str) -> UserRow | None:
         """Fetch user by username."""
-        row = self._conn.execute(
-            "SELECT id, username, password_hash, role, totp_secret, created_at, updated_at "
-            "FROM users WHERE username = ?",
-            (username,),
-        ).fetchone()
+        row = self._conn.execute(_USER_BY_USERNAME, (username,)).fetchone()
         if row is None:
             return None
         return UserRow(
@@ -114,11 +121,7 @@ class AuthDB:
 
     def get_user_by_id(self, user_id: str) -> UserRow | None:
         """Fetch user by ID."""
-        row = self._conn.execute(
-            "SELECT id, username, password_hash, role, totp_secret, created_at, updated_at "
-            "FROM users WHERE id = ?",
-            (user_id,),
-        ).fetchone()
+        row = self._conn.execute(_USER_BY_ID, (user_id,)).fetchone()
         if row is None:
             return None
         return UserRow(
@@ -133,10 +136,7 @@ class AuthDB:
 
     def list_users(self) -> list[UserRow]:
         """List all users."""
-        rows = self._conn.execute(
-            "SELECT id, username, password_hash, role, totp_secret, created_at, updated_at "
-            "FROM users ORDER BY created_at"
-        ).fetchall()
+        rows = self._conn.execute(_USERS_BY_CREATED).fetchall()
         return [
             UserRow(
                 id=r["id"],
@@ -185,11 +185,10 @@ class AuthDB:
         self._conn.execute(
             "DELETE FROM totp_backup_codes WHERE user_id = ?", (user_id,)
         )
-        for code_hash in code_hashes:
-            self._conn.execute(
-                "INSERT INTO totp_backup_codes (user_id, code_hash) VALUES (?, ?)",
-                (user_id, code_hash),
-            )
+        self._conn.executemany(
+            "INSERT INTO totp_backup_codes (user_id, code_hash) VALUES (?, ?)",
+            [(user_id, code_hash) for code_hash in code_hashes],
+        )
         self._conn.commit()
 
     def verify_backup_code(self, user_id: str, code_hash: str) -> bool: